@@ -0,0 +1,88 @@
+"""
+Load test for the OctoDollop server
+
+Run from the server directory, e.g.:
+
+    python -m loadtest --url http://127.0.0.1:8080 --duration 30 --concurrency 16 --rate 40
+    python -m loadtest --workers 4 8 20 --worker-class sync gthread --duration 30 --concurrency 32
+"""
+import argparse
+import itertools
+import json
+import sys
+
+from .runner import (LoadResult, run_load)
+from .server import GunicornServer
+from .traffic import (recorded_traffic, synthetic_traffic)
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog='python -m loadtest', description='Replays traffic against the server')
+    parser.add_argument('--url', default='http://127.0.0.1:8080',
+                        help='running server to target, ignored when sweeping worker configurations')
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds of traffic per run')
+    parser.add_argument('--concurrency', type=int, default=8, help='maximum in-flight requests')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='mean arrival rate in requests per second, closed loop if omitted')
+    parser.add_argument('--traffic', default=None, help='JSON lines recording to replay, synthetic if omitted')
+    parser.add_argument('--rating-share', type=float, default=0.8,
+                        help='share of synthetic /rating requests, the rest target /ai/bounding_boxes')
+    parser.add_argument('--timeout', type=float, default=30.0, help='single request timeout in seconds')
+    parser.add_argument('--seed', type=int, default=None, help='random seed for reproducible runs')
+    parser.add_argument('--workers', type=int, nargs='+', default=None,
+                        help='gunicorn worker counts to sweep, each run spawns a local server')
+    parser.add_argument('--worker-class', nargs='+', default=['sync'], help='gunicorn worker classes to sweep')
+    parser.add_argument('--port', type=int, default=8081, help='local port used when sweeping')
+    parser.add_argument('--json', default=None, help='file the results are written to, as JSON')
+    args = parser.parse_args(argv)
+
+    if not 0 <= args.rating_share <= 1:
+        parser.error('--rating-share must range from 0 to 1')
+
+    def traffic():
+        if args.traffic is not None:
+            return recorded_traffic(args.traffic)
+        return synthetic_traffic(args.rating_share, args.seed)
+
+    def load(base_url: str) -> LoadResult:
+        return run_load(traffic(), base_url, args.duration, args.concurrency, args.rate, args.timeout, args.seed)
+
+    results: list[dict] = list()
+    if args.workers is None:
+        result = load(args.url)
+        print_summary(args.url, result)
+        results.append({'url': args.url, 'summary': result.summary()})
+    else:
+        for workers, worker_class in itertools.product(args.workers, args.worker_class):
+            with GunicornServer(workers, worker_class, args.port) as server:
+                result = load(server.base_url)
+            print_summary(f'{workers} {worker_class} workers', result)
+            results.append({'workers': workers, 'worker_class': worker_class, 'summary': result.summary()})
+    if args.json is not None:
+        with open(args.json, 'w') as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+def print_summary(title: str, result: LoadResult):
+    """
+    Prints the per endpoint statistics of a run
+
+    Parameters:
+    -----------
+    title : str
+        The run description
+    result : LoadResult
+        The run outcome
+    """
+    print(f'== {title} ({result.elapsed:.1f}s)')
+    print(f'{"endpoint":<16}{"requests":>10}{"errors":>8}{"err %":>8}{"req/s":>9}'
+          f'{"p50 ms":>9}{"p90 ms":>9}{"p99 ms":>9}{"max ms":>9}')
+    for endpoint, stats in result.summary().items():
+        print(f'{endpoint:<16}{stats["requests"]:>10}{stats["errors"]:>8}{stats["error_rate"] * 100:>8.1f}'
+              f'{stats["throughput"]:>9.1f}{stats["p50"]:>9.1f}{stats["p90"]:>9.1f}{stats["p99"]:>9.1f}'
+              f'{stats["max"]:>9.1f}')
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
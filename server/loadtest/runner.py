@@ -0,0 +1,200 @@
+import math
+import random
+import threading
+import time
+from concurrent.futures import (Future, ThreadPoolExecutor)
+from http.client import HTTPException
+from typing import Final, Iterator, Optional
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from .traffic import TrafficItem
+
+
+class Sample:
+
+    def __init__(self, endpoint: str, latency: float, status: Optional[int]):
+        """
+        Outcome of a single request
+
+        Parameters:
+        -----------
+        endpoint : str
+            The endpoint the request was sent to
+        latency : float
+            The time between the request's scheduled send time and its completion, in seconds
+        status : int | None
+            The HTTP status code, None if the request failed before getting a response
+        """
+        self.endpoint: Final[str] = endpoint
+        self.latency: Final[float] = latency
+        self.status: Final[Optional[int]] = status
+
+    @property
+    def is_error(self) -> bool:
+        return self.status is None or self.status >= 400
+
+
+class LoadResult:
+
+    def __init__(self, samples: list[Sample], elapsed: float):
+        """
+        Parameters:
+        -----------
+        samples : list[Sample]
+            The outcome of every request sent during the run
+        elapsed : float
+            The run wall clock duration, in seconds
+        """
+        self.samples: Final[list[Sample]] = samples
+        self.elapsed: Final[float] = elapsed
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Returns:
+        --------
+        dict[str, dict[str, float]]
+            Per endpoint statistics (plus an 'all' entry), with keys 'requests', 'errors', 'error_rate',
+            'throughput' (successful requests per second), 'mean', 'p50', 'p90', 'p95', 'p99' and 'max'.
+            Latencies are in milliseconds
+        """
+        by_endpoint: dict[str, list[Sample]] = {'all': self.samples}
+        for sample in self.samples:
+            by_endpoint.setdefault(sample.endpoint, list()).append(sample)
+        return {endpoint: self.__stats(samples) for endpoint, samples in by_endpoint.items()}
+
+    def __stats(self, samples: list[Sample]) -> dict[str, float]:
+        """
+        Parameters:
+        -----------
+        samples : list[Sample]
+            The samples to be summarized
+
+        Returns:
+        --------
+        dict[str, float]
+            The samples statistics
+        """
+        latencies = sorted(sample.latency * 1000 for sample in samples)
+        errors = sum(1 for sample in samples if sample.is_error)
+        return {
+            'requests': len(samples),
+            'errors': errors,
+            'error_rate': errors / len(samples) if samples else 0.0,
+            'throughput': (len(samples) - errors) / self.elapsed if self.elapsed > 0 else 0.0,
+            'mean': sum(latencies) / len(latencies) if latencies else 0.0,
+            'p50': percentile(latencies, 50),
+            'p90': percentile(latencies, 90),
+            'p95': percentile(latencies, 95),
+            'p99': percentile(latencies, 99),
+            'max': latencies[-1] if latencies else 0.0,
+        }
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Nearest-rank percentile
+
+    Parameters:
+    -----------
+    values : list[float]
+        The sorted values
+    q : float
+        The percentile, ranging from 0 to 100
+
+    Returns:
+    --------
+    float
+        The q-th percentile of the values, 0 if there are none
+    """
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(values)))
+    return values[min(rank, len(values)) - 1]
+
+
+def run_load(traffic: Iterator[TrafficItem], base_url: str, duration: float, concurrency: int,
+             rate: Optional[float] = None, timeout: float = 30.0, seed: Optional[int] = None) -> LoadResult:
+    """
+    Sends traffic to the server for the given duration
+
+    With no arrival rate, `concurrency` clients send requests back to back (closed loop). With an arrival rate,
+    requests are scheduled following a Poisson process and served by up to `concurrency` in-flight connections
+    (open loop): latencies are then measured from the scheduled send time, so queueing on the client side
+    caused by a saturated server is accounted for
+
+    Parameters:
+    -----------
+    traffic : Iterator[TrafficItem]
+        The requests to be sent
+    base_url : str
+        The server base url, e.g. 'http://127.0.0.1:8080'
+    duration : float
+        The time during which new requests are issued, in seconds
+    concurrency : int
+        The maximum number of in-flight requests
+    rate : float | None
+        The mean arrival rate, in requests per second
+    timeout : float
+        The single request timeout, in seconds
+    seed : int | None
+        The random seed for the arrival process
+
+    Returns:
+    --------
+    LoadResult
+        The outcome of the run
+    """
+    if concurrency < 1:
+        raise ValueError('Concurrency must be at least 1')
+    if rate is not None and rate <= 0:
+        raise ValueError('Arrival rate must be positive')
+    samples: list[Sample] = list()
+    lock = threading.Lock()
+
+    def send(item: TrafficItem, scheduled: float):
+        status: Optional[int] = None
+        try:
+            with urlopen(item.to_request(base_url), timeout=timeout) as response:
+                response.read()
+                status = response.status
+        except HTTPError as error:
+            status = error.code
+        except (OSError, HTTPException):
+            # Connection failures, timeouts and malformed responses (e.g. an overloaded server closing early)
+            pass
+        sample = Sample(item.endpoint, time.perf_counter() - scheduled, status)
+        with lock:
+            samples.append(sample)
+
+    futures: list[Future] = list()
+    start = time.perf_counter()
+    deadline = start + duration
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        if rate is None:
+            traffic_lock = threading.Lock()
+
+            def client():
+                while time.perf_counter() < deadline:
+                    with traffic_lock:
+                        item = next(traffic)
+                    send(item, time.perf_counter())
+
+            for _ in range(concurrency):
+                futures.append(executor.submit(client))
+        else:
+            rng = random.Random(seed)
+            scheduled = start
+            while True:
+                scheduled += rng.expovariate(rate)
+                if scheduled >= deadline:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(send, next(traffic), scheduled))
+    elapsed = time.perf_counter() - start
+    # A failed client or request would otherwise silently lower the load or drop its sample
+    for future in futures:
+        future.result()
+    return LoadResult(samples, elapsed)
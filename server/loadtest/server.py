@@ -0,0 +1,96 @@
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Final, IO, Optional
+
+# Directory holding gunicorn_config.py and the octodollop package
+SERVER_DIR: Final[str] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Number of trailing gunicorn log lines reported when the server fails to start
+LOG_TAIL_LINES: Final[int] = 20
+
+
+class GunicornServer:
+
+    def __init__(self, workers: int, worker_class: str, port: int, startup_timeout: float = 30.0):
+        """
+        Local gunicorn instance serving the app, to be used as a context manager.
+        Settings not overridden here are read from gunicorn_config.py
+
+        Parameters:
+        -----------
+        workers : int
+            The number of worker processes
+        worker_class : str
+            The gunicorn worker class, e.g. 'sync', 'gthread', 'gevent'
+        port : int
+            The local port to bind to
+        startup_timeout : float
+            The time to wait for the server to accept connections, in seconds
+        """
+        self.workers: Final[int] = workers
+        self.worker_class: Final[str] = worker_class
+        self.port: Final[int] = port
+        self.startup_timeout: Final[float] = startup_timeout
+        self.__process: Optional[subprocess.Popen] = None
+        self.__log: Optional[IO[bytes]] = None
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self.port}'
+
+    def __enter__(self):
+        command = [
+            sys.executable, '-m', 'gunicorn',
+            '-c', 'gunicorn_config.py',
+            '-b', f'127.0.0.1:{self.port}',
+            '-w', str(self.workers),
+            '-k', self.worker_class,
+            'octodollop:create_app()',
+        ]
+        # gunicorn logs to stderr for the whole run, a file (unlike a pipe) never fills up and blocks it
+        self.__log = tempfile.TemporaryFile()
+        self.__process = subprocess.Popen(command, cwd=SERVER_DIR, stdout=subprocess.DEVNULL, stderr=self.__log)
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.__process.poll() is not None:
+                code = self.__process.returncode
+                log = self.__log_tail()
+                self.__exit__(None, None, None)
+                raise RuntimeError(f'gunicorn exited with code {code} '
+                                   f'({self.workers} {self.worker_class} workers):\n{log}')
+            try:
+                with socket.create_connection(('127.0.0.1', self.port), timeout=1):
+                    return self
+            except OSError:
+                time.sleep(0.2)
+        log = self.__log_tail()
+        self.__exit__(None, None, None)
+        raise RuntimeError(f'gunicorn did not start within {self.startup_timeout}s:\n{log}')
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.__process is not None:
+            if self.__process.poll() is None:
+                self.__process.terminate()
+                try:
+                    self.__process.wait(timeout=30)
+                except subprocess.TimeoutExpired:
+                    self.__process.kill()
+                    self.__process.wait()
+            self.__process = None
+        if self.__log is not None:
+            self.__log.close()
+            self.__log = None
+
+    def __log_tail(self) -> str:
+        """
+        Returns:
+        --------
+        str
+            The last lines gunicorn wrote to stderr
+        """
+        self.__log.seek(0)
+        lines = self.__log.read().decode(errors='replace').splitlines()
+        return '\n'.join(lines[-LOG_TAIL_LINES:])
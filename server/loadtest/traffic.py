@@ -0,0 +1,205 @@
+import json
+import random
+import uuid
+from typing import Final, Iterator, Optional
+from urllib.request import Request
+
+import cv2
+import numpy as np
+
+RATING_ENDPOINT: Final[str] = 'rating'
+BOUNDING_BOXES_ENDPOINT: Final[str] = 'bounding_boxes'
+
+# Canvas sizes of commonly targeted devices (SE, Pro Max, iPad)
+__device_canvases: Final[list[dict[str, float]]] = [
+    {'width': 375.0, 'height': 667.0},
+    {'width': 428.0, 'height': 926.0},
+    {'width': 1024.0, 'height': 1366.0},
+]
+
+
+class TrafficItem:
+
+    def __init__(self, endpoint: str, body: bytes, content_type: str):
+        """
+        A single request to be sent to the server
+
+        Parameters:
+        -----------
+        endpoint : str
+            The target endpoint, either 'rating' or 'bounding_boxes'
+        body : bytes
+            The encoded request body
+        content_type : str
+            The request body content type
+        """
+        self.endpoint: Final[str] = endpoint
+        self.body: Final[bytes] = body
+        self.content_type: Final[str] = content_type
+
+    @classmethod
+    def rating(cls, payload: dict):
+        """ Instantiates a '/rating' request from its JSON payload """
+        return cls(RATING_ENDPOINT, json.dumps(payload).encode('utf-8'), 'application/json')
+
+    @classmethod
+    def bounding_boxes(cls, image: bytes, extension: str = 'png'):
+        """ Instantiates a '/ai/bounding_boxes' request from the encoded image """
+        boundary = uuid.uuid4().hex
+        # Unique file names, as the server stores uploads in a shared folder
+        filename = f'image-{boundary}.{extension}'
+        body = b''.join([
+            f'--{boundary}\r\n'.encode('utf-8'),
+            f'Content-Disposition: form-data; name="image"; filename="{filename}"\r\n'.encode('utf-8'),
+            f'Content-Type: image/{extension}\r\n\r\n'.encode('utf-8'),
+            image,
+            f'\r\n--{boundary}--\r\n'.encode('utf-8'),
+        ])
+        return cls(BOUNDING_BOXES_ENDPOINT, body, f'multipart/form-data; boundary={boundary}')
+
+    def to_request(self, base_url: str) -> Request:
+        """
+        Parameters:
+        -----------
+        base_url : str
+            The server base url, e.g. 'http://127.0.0.1:8080'
+
+        Returns:
+        --------
+        Request
+            The HTTP request ready to be sent
+        """
+        path = 'rating' if self.endpoint == RATING_ENDPOINT else 'ai/bounding_boxes'
+        return Request(f'{base_url.rstrip("/")}/{path}', data=self.body, method='POST',
+                       headers={'Content-Type': self.content_type})
+
+
+def synthetic_rating_payload(rng: random.Random) -> dict:
+    """
+    Generates a random '/rating' request payload
+
+    Parameters:
+    -----------
+    rng : random.Random
+        The random generator to draw from
+
+    Returns:
+    --------
+    dict
+        The JSON payload, with keys 'canvas' and 'items'
+    """
+    items = list()
+    for _ in range(rng.randint(3, 25)):
+        width = rng.uniform(0.05, 0.9)
+        height = rng.uniform(0.02, 0.3)
+        items.append({
+            'x': rng.uniform(0, 1 - width),
+            'y': rng.uniform(0, 1 - height),
+            'width': width,
+            'height': height,
+        })
+    return {'canvas': dict(rng.choice(__device_canvases)), 'items': items}
+
+
+def synthetic_screenshot(rng: random.Random, width: int = 750, height: int = 1334) -> bytes:
+    """
+    Draws a random screenshot-like image made of boxes and text lines
+
+    Parameters:
+    -----------
+    rng : random.Random
+        The random generator to draw from
+    width : int
+        The image width, in pixels
+    height : int
+        The image height, in pixels
+
+    Returns:
+    --------
+    bytes
+        The PNG encoded image
+    """
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    for _ in range(rng.randint(4, 16)):
+        w = rng.randint(width // 10, width - 20)
+        h = rng.randint(height // 40, height // 6)
+        x = rng.randint(0, width - w)
+        y = rng.randint(0, height - h)
+        shade = rng.randint(0, 120)
+        if rng.random() < 0.5:
+            cv2.rectangle(image, (x, y), (x + w, y + h), (shade, shade, shade), -1)
+        else:
+            cv2.putText(image, 'Lorem ipsum', (x, y + h // 2), cv2.FONT_HERSHEY_SIMPLEX,
+                        1.0, (shade, shade, shade), 2)
+    encoded = cv2.imencode('.png', image)[1]
+    return encoded.tobytes()
+
+
+def synthetic_traffic(rating_share: float, seed: Optional[int] = None, screenshots: int = 8) -> Iterator[TrafficItem]:
+    """
+    Endless stream of synthetic requests
+
+    Parameters:
+    -----------
+    rating_share : float
+        The share of '/rating' requests, ranging from 0 to 1. The remaining requests target '/ai/bounding_boxes'
+    seed : int | None
+        The random seed, for reproducible runs
+    screenshots : int
+        The number of distinct screenshots to cycle through
+
+    Returns:
+    --------
+    Iterator[TrafficItem]
+        The requests to be sent
+    """
+    rng = random.Random(seed)
+    # Encoding images is expensive, generate a small pool once
+    images = [synthetic_screenshot(rng) for _ in range(screenshots)] if rating_share < 1 else []
+    while True:
+        if rng.random() < rating_share:
+            yield TrafficItem.rating(synthetic_rating_payload(rng))
+        else:
+            yield TrafficItem.bounding_boxes(rng.choice(images))
+
+
+def recorded_traffic(path: str) -> Iterator[TrafficItem]:
+    """
+    Endless stream of requests cycling through a recording
+
+    The recording is a JSON lines file, each line being either
+    {"endpoint": "rating", "body": {...}} or {"endpoint": "bounding_boxes", "image": "path/to/screenshot.png"}
+
+    Parameters:
+    -----------
+    path : str
+        The path to the recording
+
+    Returns:
+    --------
+    Iterator[TrafficItem]
+        The requests to be sent
+    """
+    recording: list[tuple[str, object]] = list()
+    with open(path) as file:
+        for line in file:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if entry['endpoint'] == RATING_ENDPOINT:
+                recording.append((RATING_ENDPOINT, entry['body']))
+            elif entry['endpoint'] == BOUNDING_BOXES_ENDPOINT:
+                with open(entry['image'], 'rb') as image:
+                    extension = entry['image'].rsplit('.', 1)[1].lower()
+                    recording.append((BOUNDING_BOXES_ENDPOINT, (image.read(), extension)))
+            else:
+                raise ValueError(f'Unknown endpoint {entry["endpoint"]}, '
+                                 f'choose between {[RATING_ENDPOINT, BOUNDING_BOXES_ENDPOINT]}')
+    if not recording:
+        raise ValueError(f'Recording {path} is empty')
+    while True:
+        for endpoint, data in recording:
+            if endpoint == RATING_ENDPOINT:
+                yield TrafficItem.rating(data)
+            else:
+                yield TrafficItem.bounding_boxes(*data)
@@ -5,6 +5,8 @@ from flask import (Flask, request)
 def create_app():
     app = Flask(__name__)
     app.config['UPLOAD_FOLDER'] = os.path.join(app.instance_path, 'uploads')
+    # Maximum number of pixels image raters analyze, larger screenshots are downscaled
+    app.config['IMAGE_PIXEL_BUDGET'] = 1_000_000
 
     # ensure the instance folder exists
     try:
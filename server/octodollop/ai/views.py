@@ -1,6 +1,13 @@
-from ..opencv import get_bb
+from ..opencv import (get_bb, detect_bb, threshold, fit_pixel_budget, content_mass)
+from ..rater import (Element, Canvas, LayoutNode, get_image_rater)
+from ..rating.helpers import (rate_layout, overall_score)
+from ..rating.models import (MetricGroup, RatingResponse)
 from flask import (Blueprint, request, current_app, jsonify, abort)
+from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
+from typing import Final
+import cv2
+import numpy as np
 import os
 
 bp = Blueprint('ai', __name__, url_prefix='/ai')
@@ -13,9 +20,7 @@ def get_bounding_boxes():
     if image is None or not allowed_file(image.filename):
         abort(400)
     # Saving request files
-    filename = secure_filename(image.filename)
-    filepath = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
-    image.save(filepath)
+    filepath = save_file(image)
     # Processing request
     items = get_bb(filepath)
     # Clean up
@@ -24,5 +29,58 @@ def get_bounding_boxes():
     return jsonify(items)
 
 
+@bp.route('/rating', methods=['POST'])
+def rate_screenshot():
+    # Parsing request files
+    image = request.files.get('image')
+    if image is None or not allowed_file(image.filename):
+        abort(400)
+    # Decoding in memory, a file in the shared uploads folder could be overwritten by a concurrent request
+    screenshot = cv2.imdecode(np.frombuffer(image.read(), np.uint8), cv2.IMREAD_COLOR)
+    if screenshot is None:
+        abort(400)
+    # Detecting elements
+    thresh = threshold(screenshot)
+    elements = [Element.from_json(item) for item in detect_bb(screenshot, thresh)]
+    if not elements:
+        abort(400)
+    height, width = screenshot.shape[:2]
+    canvas = Canvas(width, height)
+    # Layout ratings
+    response = rate_layout(LayoutNode.root(elements), canvas)
+    # Image ratings, on a copy bounded by the pixel budget. Pixel masses are looked up in the
+    # summed-area table of that copy's content mask, built once for all raters
+    budget_screenshot = fit_pixel_budget(screenshot, current_app.config['IMAGE_PIXEL_BUDGET'])
+    mass = content_mass(thresh if budget_screenshot is screenshot else threshold(budget_screenshot))
+    ratings: list[MetricGroup] = list(response.metrics)
+    for rater_type in __image_raters:
+        rater = get_image_rater(rater_type, elements, canvas, budget_screenshot, mass)
+        ratings.append(MetricGroup(rater_type, rater.rate()))
+    # Response
+    response = RatingResponse(overall_score(ratings), ratings, response.containers)
+    return jsonify(response.serialize())
+
+
 def allowed_file(filename: str) -> bool:
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ['png', 'jpg', 'jpeg']
\ No newline at end of file
+    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ['png', 'jpg', 'jpeg']
+
+
+def save_file(file: FileStorage) -> str:
+    """
+    Parameters:
+    -----------
+    file : FileStorage
+        The uploaded file
+
+    Returns:
+    --------
+    str
+        The path the file was saved to, in the uploads folder
+    """
+    filename = secure_filename(file.filename)
+    filepath = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
+    file.save(filepath)
+    return filepath
+
+
+__image_raters: Final[list[str]] = ['contrast', 'color', 'pixel_balance', 'pixel_symmetry']
@@ -1 +1,2 @@
-from .helpers import get_bb
+from .helpers import (get_bb, detect_bb, threshold, fit_pixel_budget)
+from .regions import (box_pixels, box_histograms, IntegralImage, content_mass)
@@ -1,5 +1,6 @@
 import cv2
 import numpy as np
+from typing import Optional
 
 
 def get_bb(path: str) -> list[dict[str, float]]:
@@ -16,9 +17,24 @@ def get_bb(path: str) -> list[dict[str, float]]:
     dict[str, float]
         The normalized coordinates of the discovered UI elements, in a dict with keys 'x', 'y', 'w', 'h'
     """
-    # Load image, convert to grayscale, and Otsu's threshold
-    image = cv2.imread(path)
-    original_width, original_height, _ = image.shape
+    return detect_bb(cv2.imread(path))
+
+
+def threshold(image: np.ndarray) -> np.ndarray:
+    """
+    Separates UI content from the screen background
+
+    Parameters:
+    -----------
+    image : np.ndarray
+        The BGR image to be analyzed
+
+    Returns:
+    --------
+    np.ndarray
+        The grayscale mask, 255 for content pixels and 0 for background ones
+    """
+    # Convert to grayscale, and Otsu's threshold
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     thresh = np.ones_like(gray) * 255
     t = cv2.threshold(gray, 0, 255, cv2.THRESH_OTSU)[0]
@@ -27,6 +43,28 @@ def get_bb(path: str) -> list[dict[str, float]]:
         thresh[gray < t] = 0
     else:
         thresh[gray > t] = 0
+    return thresh
+
+
+def detect_bb(image: np.ndarray, thresh: Optional[np.ndarray] = None) -> list[dict[str, float]]:
+    """
+    Finds the bounding boxes of UI elements in a screenshot
+
+    Parameters:
+    -----------
+    image : np.ndarray
+        The BGR image to be analyzed
+    thresh : np.ndarray | None
+        The image content mask, as returned by `threshold`, computed if not provided
+
+    Returns:
+    --------
+    dict[str, float]
+        The normalized coordinates of the discovered UI elements, in a dict with keys 'x', 'y', 'w', 'h'
+    """
+    original_width, original_height, _ = image.shape
+    # Contours are drawn onto the mask, leave the caller's one untouched
+    thresh = threshold(image) if thresh is None else thresh.copy()
     # Find contours and extract the bounding rectangle coordinates
     contours = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
     contours = contours[0] if len(contours) == 2 else contours[1]
@@ -56,3 +94,27 @@ def get_bb(path: str) -> list[dict[str, float]]:
         normalized_contours.append(normalized_coords)
 
     return normalized_contours
+
+
+def fit_pixel_budget(image: np.ndarray, max_pixels: int) -> np.ndarray:
+    """
+    Downscales an image, preserving its aspect ratio, so that it holds at most the given number of pixels
+
+    Parameters:
+    -----------
+    image : np.ndarray
+        The image to be downscaled
+    max_pixels : int
+        The pixel budget
+
+    Returns:
+    --------
+    np.ndarray
+        The downscaled image, or the image itself if already within budget
+    """
+    height, width = image.shape[:2]
+    if height * width <= max_pixels:
+        return image
+    scale = (max_pixels / (height * width)) ** 0.5
+    size = (max(1, int(width * scale)), max(1, int(height * scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
@@ -0,0 +1,172 @@
+import cv2
+import numpy as np
+from typing import Final, Optional, Union
+
+
+def box_pixels(shape: tuple[int, int], boxes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Enumerates the pixels covered by each box at once, without looping over the boxes
+
+    Parameters:
+    -----------
+    shape : tuple[int, int]
+        The image height and width
+    boxes : np.ndarray
+        The integer boxes, one row per box with columns x, y, width, height
+
+    Returns:
+    --------
+    tuple[np.ndarray, np.ndarray]
+        For every covered pixel, the index of its box and its flat index in the image.
+        Pixels covered by several boxes are listed once per box
+    """
+    height, width = shape
+    x = np.clip(boxes[:, 0], 0, width)
+    y = np.clip(boxes[:, 1], 0, height)
+    w = np.clip(boxes[:, 0] + boxes[:, 2], 0, width) - x
+    h = np.clip(boxes[:, 1] + boxes[:, 3], 0, height) - y
+    areas = np.maximum(w, 0) * np.maximum(h, 0)
+    box_ids = np.repeat(np.arange(len(boxes)), areas)
+    # Offset of each pixel within its own box, in row-major order
+    starts = np.cumsum(areas) - areas
+    offsets = np.arange(areas.sum()) - np.repeat(starts, areas)
+    box_widths = np.repeat(w, areas)
+    rows = np.repeat(y, areas) + offsets // box_widths
+    cols = np.repeat(x, areas) + offsets % box_widths
+    return box_ids, rows * width + cols
+
+
+def box_histograms(bins: np.ndarray, bin_count: int, box_ids: np.ndarray, pixels: np.ndarray,
+                   weights: Optional[np.ndarray] = None, box_count: Optional[int] = None) -> np.ndarray:
+    """
+    Computes a histogram per box in a single pass
+
+    Parameters:
+    -----------
+    bins : np.ndarray
+        The image of per pixel bin indexes, negative indexes are left out
+    bin_count : int
+        The number of bins
+    box_ids : np.ndarray
+        The box index of every covered pixel, as returned by `box_pixels`
+    pixels : np.ndarray
+        The flat image index of every covered pixel, as returned by `box_pixels`
+    weights : np.ndarray | None
+        The image of per pixel weights, pixels are counted if not provided
+    box_count : int | None
+        The number of boxes, inferred from `box_ids` if not provided
+
+    Returns:
+    --------
+    np.ndarray
+        The histograms, one row per box
+    """
+    box_count = box_count if box_count is not None else int(box_ids.max(initial=-1)) + 1
+    pixel_bins = bins.ravel()[pixels]
+    kept = pixel_bins >= 0
+    keys = box_ids[kept] * bin_count + pixel_bins[kept]
+    pixel_weights = weights.ravel()[pixels][kept] if weights is not None else None
+    histograms = np.bincount(keys, weights=pixel_weights, minlength=box_count * bin_count)
+    return histograms.reshape(box_count, bin_count)
+
+
+class IntegralImage:
+
+    def __init__(self, mask: np.ndarray):
+        """
+        Summed-area table of an image content mask, built in a single pass.
+        The content of any rectangular region is then an O(1) lookup
+
+        Parameters:
+        -----------
+        mask : np.ndarray
+            The content mask, non-zero pixels being content
+        """
+        self.height: Final[int] = mask.shape[0]
+        self.width: Final[int] = mask.shape[1]
+        # table[y, x] holds the content of the pixels above and left of (x, y)
+        self.table: Final[np.ndarray] = cv2.integral(np.minimum(mask, 1).astype(np.uint8), sdepth=cv2.CV_32S)
+
+    def region(self, x: Union[int, np.ndarray], y: Union[int, np.ndarray],
+               width: Union[int, np.ndarray], height: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
+        """
+        Parameters:
+        -----------
+        x : int | np.ndarray
+            The region(s) x pixel coordinate
+        y : int | np.ndarray
+            The region(s) y pixel coordinate
+        width : int | np.ndarray
+            The region(s) width, in pixels
+        height : int | np.ndarray
+            The region(s) height, in pixels
+
+        Returns:
+        --------
+        int | np.ndarray
+            The number of content pixels in the region(s), regions are clipped to the image
+        """
+        x1, x2 = np.clip(x, 0, self.width), np.clip(np.add(x, width), 0, self.width)
+        y1, y2 = np.clip(y, 0, self.height), np.clip(np.add(y, height), 0, self.height)
+        return self.table[y2, x2] - self.table[y1, x2] - self.table[y2, x1] + self.table[y1, x1]
+
+    def columns(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        """
+        Parameters:
+        -----------
+        x : int
+            The region x pixel coordinate
+        y : int
+            The region y pixel coordinate
+        width : int
+            The region width, in pixels
+        height : int
+            The region height, in pixels
+
+        Returns:
+        --------
+        np.ndarray
+            The number of content pixels in each of the region columns, regions are clipped to the image
+        """
+        x1, x2 = np.clip([x, x + width], 0, self.width)
+        y1, y2 = np.clip([y, y + height], 0, self.height)
+        return np.diff(self.table[y2, x1:x2 + 1] - self.table[y1, x1:x2 + 1])
+
+    def rows(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        """
+        Parameters:
+        -----------
+        x : int
+            The region x pixel coordinate
+        y : int
+            The region y pixel coordinate
+        width : int
+            The region width, in pixels
+        height : int
+            The region height, in pixels
+
+        Returns:
+        --------
+        np.ndarray
+            The number of content pixels in each of the region rows, regions are clipped to the image
+        """
+        x1, x2 = np.clip([x, x + width], 0, self.width)
+        y1, y2 = np.clip([y, y + height], 0, self.height)
+        return np.diff(self.table[y1:y2 + 1, x2] - self.table[y1:y2 + 1, x1])
+
+
+def content_mass(thresh: np.ndarray) -> IntegralImage:
+    """
+    Parameters:
+    -----------
+    thresh : np.ndarray
+        The thresholded screenshot, as returned by `threshold`
+
+    Returns:
+    --------
+    IntegralImage
+        The summed-area table of the screen content, the background being the most common of the two classes
+    """
+    if np.count_nonzero(thresh) > thresh.size / 2:
+        thresh = cv2.bitwise_not(thresh)
+    return IntegralImage(thresh)
@@ -2,12 +2,22 @@ from .balance import BalanceRater
 from .equilibrium import EquilibriumRater
 from .symmetry import SymmetryRater
 from .harmony import HarmonyRater
+from .contrast import ContrastRater
+from .color import ColorRater
+from .pixel_balance import PixelBalanceRater
+from .pixel_symmetry import PixelSymmetryRater
 from .rater import Rater
-from .models import (Element, Canvas, Rating)
-from typing import Final
+from .image import ImageRater
+from .models import (Element, Container, Canvas, Rating)
+from .aggregate import (Aggregate, Quadrants)
+from .layout import LayoutNode
+from ..opencv import IntegralImage
+from typing import Final, Optional
+import numpy as np
 
 
-def get_rater(value: str, elements: list[Element], canvas: Canvas) -> Rater:
+def get_rater(value: str, elements: list[Element], canvas: Canvas, quadrants: Optional[Quadrants] = None,
+              proportion: Optional[float] = None) -> Rater:
     """
     Parameters:
     ----------
@@ -17,6 +27,10 @@ def get_rater(value: str, elements: list[Element], canvas: Canvas) -> Rater:
         The elements relative to the UI to be rated
     canvas : Canvas
         The canvas in which the elements belong to
+    quadrants : Quadrants | None
+        The precomputed summary of the visible content in the canvas absolute coordinates
+    proportion : float | None
+        The precomputed similarity of the elements aspect ratios
 
     Returns:
     ------
@@ -25,7 +39,33 @@ def get_rater(value: str, elements: list[Element], canvas: Canvas) -> Rater:
     """
     if value not in __available_raters:
         raise ValueError(f'Rater {value} does not exist, choose between {__available_raters.keys()}')
-    return __available_raters[value](elements=elements, canvas=canvas)
+    return __available_raters[value](elements=elements, canvas=canvas, quadrants=quadrants, proportion=proportion)
+
+
+def get_image_rater(value: str, elements: list[Element], canvas: Canvas, image: np.ndarray,
+                    mass: Optional[IntegralImage] = None) -> ImageRater:
+    """
+    Parameters:
+    ----------
+    value : str
+        The image rater type to be instantiated, either 'contrast', 'color', 'pixel_balance' or 'pixel_symmetry'
+    elements : list[Element]
+        The elements relative to the UI to be rated
+    canvas : Canvas
+        The canvas in which the elements belong to
+    image : np.ndarray
+        The BGR screenshot the elements were detected in
+    mass : IntegralImage | None
+        The summed-area table of the screenshot content mask, shared by the raters weighting content by pixels
+
+    Returns:
+    ------
+    ImageRater
+        The desired rater instance
+    """
+    if value not in __available_image_raters:
+        raise ValueError(f'Image rater {value} does not exist, choose between {__available_image_raters.keys()}')
+    return __available_image_raters[value](elements=elements, canvas=canvas, image=image, mass=mass)
 
 
 __available_raters: Final[dict[str:Rater]] = {
@@ -34,3 +74,10 @@ __available_raters: Final[dict[str:Rater]] = {
     'symmetry': SymmetryRater,
     'harmony': HarmonyRater
 }
+
+__available_image_raters: Final[dict[str:ImageRater]] = {
+    'contrast': ContrastRater,
+    'color': ColorRater,
+    'pixel_balance': PixelBalanceRater,
+    'pixel_symmetry': PixelSymmetryRater
+}
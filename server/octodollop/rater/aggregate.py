@@ -0,0 +1,226 @@
+from typing import Final
+
+from .models import (Element, Canvas)
+
+
+class Aggregate:
+
+    def __init__(self, count: float = 0.0, area: float = 0.0, area_x: float = 0.0, area_y: float = 0.0,
+                 x_sum: float = 0.0, y_sum: float = 0.0, w_sum: float = 0.0, h_sum: float = 0.0):
+        """
+        Additive summary of a set of elements, expressed in a given reference frame
+
+        Parameters:
+        -----------
+        count : float
+            The number of elements
+        area : float
+            The elements total area
+        area_x : float
+            The sum of the elements midpoint x coordinates, weighted by their area
+        area_y : float
+            The sum of the elements midpoint y coordinates, weighted by their area
+        x_sum : float
+            The sum of the elements midpoint x coordinates
+        y_sum : float
+            The sum of the elements midpoint y coordinates
+        w_sum : float
+            The sum of the elements widths
+        h_sum : float
+            The sum of the elements heights
+        """
+        self.count: Final[float] = count
+        self.area: Final[float] = area
+        self.area_x: Final[float] = area_x
+        self.area_y: Final[float] = area_y
+        self.x_sum: Final[float] = x_sum
+        self.y_sum: Final[float] = y_sum
+        self.w_sum: Final[float] = w_sum
+        self.h_sum: Final[float] = h_sum
+
+    @classmethod
+    def unit(cls):
+        """ Instantiates the summary of a single element filling the unit square """
+        return cls(1.0, 1.0, 0.5, 0.5, 0.5, 0.5, 1.0, 1.0)
+
+    def __add__(self, other):
+        return Aggregate(self.count + other.count, self.area + other.area,
+                         self.area_x + other.area_x, self.area_y + other.area_y,
+                         self.x_sum + other.x_sum, self.y_sum + other.y_sum,
+                         self.w_sum + other.w_sum, self.h_sum + other.h_sum)
+
+    def transformed(self, x: float, y: float, width: float, height: float):
+        """
+        Maps the summary from the unit square to the given box
+
+        Parameters:
+        -----------
+        x : float
+            The box x coordinate in the target frame
+        y : float
+            The box y coordinate in the target frame
+        width : float
+            The box width in the target frame
+        height : float
+            The box height in the target frame
+
+        Returns:
+        --------
+        Aggregate
+            The summary in the target frame
+        """
+        scale = width * height
+        return Aggregate(self.count, scale * self.area,
+                         scale * (x * self.area + width * self.area_x),
+                         scale * (y * self.area + height * self.area_y),
+                         x * self.count + width * self.x_sum,
+                         y * self.count + height * self.y_sum,
+                         width * self.w_sum, height * self.h_sum)
+
+    def folded(self, x_pivot: float, y_pivot: float):
+        """
+        Moves the summary to a pivot-relative frame, the summarized elements lying on the same side of both axes
+
+        Parameters:
+        -----------
+        x_pivot : float
+            The x coordinate of the vertical axis
+        y_pivot : float
+            The y coordinate of the horizontal axis
+
+        Returns:
+        --------
+        Aggregate
+            The summary whose area_x, area_y are the sums of the elements areas times their midpoint distance
+            from the axes, and whose x_sum, y_sum are the sums of those distances
+        """
+        return Aggregate(self.count, self.area,
+                         abs(self.area_x - x_pivot * self.area), abs(self.area_y - y_pivot * self.area),
+                         abs(self.x_sum - x_pivot * self.count), abs(self.y_sum - y_pivot * self.count),
+                         self.w_sum, self.h_sum)
+
+
+class Quadrants:
+
+    def __init__(self, x_pivot: float, y_pivot: float):
+        """
+        Element summaries split around a pivot point, elements being assigned by midpoint.
+        Halves hold every element once, those lying on an axis belonging to the left/top half.
+        Quadrants hold elements lying on an axis in every quadrant they touch, except for those on the
+        upper vertical axis which only belong to the top left quadrant.
+        Halves and quadrants are folded around the pivot (see `Aggregate.folded`), as elements are added:
+        an element lying on an axis then weighs exactly 0 in the direction of that axis
+
+        Parameters:
+        -----------
+        x_pivot : float
+            The pivot x coordinate
+        y_pivot : float
+            The pivot y coordinate
+        """
+        self.x_pivot: Final[float] = x_pivot
+        self.y_pivot: Final[float] = y_pivot
+        self.top_left = Aggregate()
+        self.top_right = Aggregate()
+        self.bottom_left = Aggregate()
+        self.bottom_right = Aggregate()
+        self.left = Aggregate()
+        self.right = Aggregate()
+        self.top = Aggregate()
+        self.bottom = Aggregate()
+        self.total = Aggregate()
+
+    @classmethod
+    def of_elements(cls, elements: list[Element], canvas: Canvas):
+        """ Instantiates the quadrants of a flat list of elements, in the canvas absolute coordinates """
+        quadrants = cls(0.5, 0.5)
+        for element in elements:
+            quadrants.add(Aggregate.unit().transformed(element.x, element.y, element.width, element.height),
+                          element.x + element.width / 2, element.y + element.height / 2)
+        return quadrants.scaled(canvas.width, canvas.height)
+
+    def add(self, aggregate: Aggregate, x: float, y: float):
+        """
+        Accounts for a summary whose elements all share the same position relative to the axes
+
+        Parameters:
+        -----------
+        aggregate : Aggregate
+            The summary to be added
+        x : float
+            The x coordinate locating the elements
+        y : float
+            The y coordinate locating the elements
+        """
+        self.total += aggregate
+        aggregate = aggregate.folded(self.x_pivot, self.y_pivot)
+        # Halves
+        if x <= self.x_pivot:
+            self.left += aggregate
+        else:
+            self.right += aggregate
+        if y <= self.y_pivot:
+            self.top += aggregate
+        else:
+            self.bottom += aggregate
+        # Quadrants
+        if x <= self.x_pivot and y <= self.y_pivot:
+            self.top_left += aggregate
+        elif x >= self.x_pivot and y <= self.y_pivot:
+            self.top_right += aggregate
+        if x <= self.x_pivot and y >= self.y_pivot:
+            self.bottom_left += aggregate
+        if x >= self.x_pivot and y >= self.y_pivot:
+            self.bottom_right += aggregate
+
+    def scaled(self, width: float, height: float):
+        """
+        Maps the quadrants from the unit square to a canvas, elements keeping the side of the axes
+        they were assigned to in relative coordinates
+
+        Parameters:
+        -----------
+        width : float
+            The canvas width
+        height : float
+            The canvas height
+
+        Returns:
+        --------
+        Quadrants
+            The quadrants in the canvas absolute coordinates
+        """
+        quadrants = Quadrants(self.x_pivot * width, self.y_pivot * height)
+        quadrants.top_left = self.top_left.transformed(0.0, 0.0, width, height)
+        quadrants.top_right = self.top_right.transformed(0.0, 0.0, width, height)
+        quadrants.bottom_left = self.bottom_left.transformed(0.0, 0.0, width, height)
+        quadrants.bottom_right = self.bottom_right.transformed(0.0, 0.0, width, height)
+        quadrants.left = self.left.transformed(0.0, 0.0, width, height)
+        quadrants.right = self.right.transformed(0.0, 0.0, width, height)
+        quadrants.top = self.top.transformed(0.0, 0.0, width, height)
+        quadrants.bottom = self.bottom.transformed(0.0, 0.0, width, height)
+        quadrants.total = self.total.transformed(0.0, 0.0, width, height)
+        return quadrants
+
+
+def proportion_similarity(elements: list[Element]) -> float:
+    """
+    Parameters:
+    -----------
+    elements : list[Element]
+        The elements to be compared
+
+    Returns:
+    --------
+    float
+        One minus the mean relative difference between the aspect ratios of every pair of elements, ranging
+        from 0 to 1. Relative sizes are compared, so the similarity does not depend on the canvas size
+    """
+    proportions = [(el.width / el.height) for el in elements]
+    similarity = []
+    for i1, p1 in enumerate(proportions):
+        for i2, p2 in enumerate(proportions):
+            if i1 == i2:
+                continue
+            similarity.append((abs(p1 - p2)/max(p1, p2)))
+    return 1 - sum(similarity)/len(similarity) if similarity else 1.0
@@ -1,47 +1,40 @@
 from .rater import Rater
 from .models import Rating
 from .constants import MAX_SCORE
-from typing import Final
 
 
 class BalanceRater(Rater):
 
-    __h_balance_id: Final[str] = 'balance_horizontal'
-    __v_balance_id: Final[str] = 'balance_vertical'
+    _h_balance_id = 'balance_horizontal'
+    _v_balance_id = 'balance_vertical'
 
     def rate(self) -> list[Rating]:
         # Weights
-        w_left = 0.0
-        w_right = 0.0
-        w_top = 0.0
-        w_bottom = 0.0
-        # Computing
-        for element in self._elements:
-            # Updating horizontal weight
-            h_weight = element.area(self._canvas) * (element.x_midpoint(self._canvas) - self._canvas.x_midpoint)
-            if h_weight > 0:
-                w_right += h_weight
-            else:
-                w_left += abs(h_weight)
-            # Updating vertical weight
-            v_weight = element.area(self._canvas) * (element.y_midpoint(self._canvas) - self._canvas.y_midpoint)
-            if v_weight > 0:
-                w_top += v_weight
-            else:
-                w_bottom += abs(v_weight)
+        w_left, w_right, w_top, w_bottom = self._weights()
         # Results
-        norm_h_score = (w_left - w_right)/max(w_left, w_right)
-        norm_v_score = (w_top - w_bottom) / max(w_top, w_bottom)
+        norm_h_score = (w_left - w_right) / max(w_left, w_right) if max(w_left, w_right) != 0 else 0.0
+        norm_v_score = (w_bottom - w_top) / max(w_top, w_bottom) if max(w_top, w_bottom) != 0 else 0.0
         h_score_hr = int(MAX_SCORE * (1 - abs(norm_h_score)))
         v_score_hr = int(MAX_SCORE * (1 - abs(norm_v_score)))
         msg_h_suffix = 'right' if norm_h_score < 0 else 'left'
         msg_v_suffix = 'top' if norm_v_score < 0 else 'bottom'
 
         return [
-            Rating(self.__h_balance_id, h_score_hr, self.get_message(h_score_hr, msg_h_suffix)),
-            Rating(self.__v_balance_id, v_score_hr, self.get_message(v_score_hr, msg_v_suffix))
+            Rating(self._h_balance_id, h_score_hr, self.get_message(h_score_hr, msg_h_suffix)),
+            Rating(self._v_balance_id, v_score_hr, self.get_message(v_score_hr, msg_v_suffix))
         ]
 
+    def _weights(self) -> tuple[float, float, float, float]:
+        """
+        Returns:
+        --------
+        tuple[float, float, float, float]
+            The left, right, top and bottom weights, each being the sum of the masses on that side
+            times their distance from the canvas midpoint
+        """
+        return (self._quadrants.left.area_x, self._quadrants.right.area_x,
+                self._quadrants.top.area_y, self._quadrants.bottom.area_y)
+
     def get_message(self, score: int, direction: str) -> str:
         """
         Generates a human readable message for the given score
@@ -0,0 +1,113 @@
+from .image import ImageRater
+from .models import Rating
+from .constants import MAX_SCORE
+from ..opencv import (box_pixels, box_histograms)
+from typing import Final
+import cv2
+import numpy as np
+
+
+class ColorRater(ImageRater):
+
+    __palette_color_id: Final[str] = 'color_palette'
+    __consistency_color_id: Final[str] = 'color_consistency'
+
+    # OpenCV hues range from 0 to 179 (2 degrees steps), grouped in 30 degrees wide bins.
+    # Bins are centered on the primary hues, the red one wrapping around 0
+    __hue_bins: Final[int] = 12
+    __hue_offset: Final[int] = 15
+    # Pixels below these saturation/value levels are considered greys
+    __min_saturation: Final[int] = 51
+    __min_value: Final[int] = 51
+    # Share of the colored pixels a hue must cover to be part of the palette
+    __min_hue_share: Final[float] = 0.05
+    # Share of the pixels that must be colored for a box or the screen not to be considered greyscale
+    __min_colored_share: Final[float] = 0.05
+
+    def rate(self) -> list[Rating]:
+        hues, box_palettes, box_sizes = self.palettes()
+        screen_palette = np.bincount(hues[hues >= 0], minlength=self.__hue_bins)
+        if screen_palette.sum() < self.__min_colored_share * hues.size:
+            return [
+                Rating(self.__palette_color_id, MAX_SCORE, 'Greyscale palette, colors are not competing'),
+                Rating(self.__consistency_color_id, MAX_SCORE, 'Greyscale palette, colors are consistent')
+            ]
+        # Palette: the hues covering a significant share of the colored pixels
+        palette = screen_palette >= self.__min_hue_share * screen_palette.sum()
+        hues_count = int(palette.sum())
+        palette_hr = int(MAX_SCORE * max(0.0, 1 - max(0, hues_count - 3) / 6))
+        # Consistency: the share of the colored boxes pixels drawn from the screen palette. Boxes weigh by their
+        # colored pixels, so small accents (e.g. a few letters) do not outweigh the panels defining the palette
+        box_colored = box_palettes.sum(axis=1)
+        colored = box_colored >= self.__min_colored_share * np.maximum(box_sizes, 1)
+        if colored.any():
+            in_palette = box_palettes[colored][:, palette].sum() / box_colored[colored].sum()
+            consistency_hr = int(MAX_SCORE * in_palette)
+        else:
+            consistency_hr = MAX_SCORE
+        return [
+            Rating(self.__palette_color_id, palette_hr, self.get_palette_message(hues_count)),
+            Rating(self.__consistency_color_id, consistency_hr, self.get_consistency_message(consistency_hr))
+        ]
+
+    def palettes(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Computes the hue histogram of every box at once
+
+        Returns:
+        --------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The image of per pixel hue bins (-1 for greys), the hue histograms with one row per box,
+            and the number of pixels in each box
+        """
+        boxes = self._boxes()
+        hsv = cv2.cvtColor(self._image, cv2.COLOR_BGR2HSV)
+        degrees = (hsv[:, :, 0].astype(np.intp) * 2 + self.__hue_offset) % 360
+        hues = degrees * self.__hue_bins // 360
+        hues[(hsv[:, :, 1] < self.__min_saturation) | (hsv[:, :, 2] < self.__min_value)] = -1
+        box_ids, pixels = box_pixels(hues.shape, boxes)
+        box_palettes = box_histograms(hues, self.__hue_bins, box_ids, pixels, box_count=len(boxes))
+        box_sizes = np.bincount(box_ids, minlength=len(boxes))
+        return hues, box_palettes, box_sizes
+
+    def get_palette_message(self, hues_count: int) -> str:
+        """
+        Generates a human readable message for the given palette size
+
+        Parameters:
+        -----------
+        hues_count : int
+            The number of distinct hues in the palette
+
+        Returns:
+        --------
+        str
+            The human readable message
+        """
+        if hues_count <= 3:
+            return 'Harmonious color palette!'
+        elif hues_count <= 5:
+            return 'The palette is getting busy'
+        else:
+            return 'Too many competing colors'
+
+    def get_consistency_message(self, score: int) -> str:
+        """
+        Generates a human readable message for the given score
+
+        Parameters:
+        -----------
+        score : int
+            The raw score from which the message will be extrapolated
+
+        Returns:
+        --------
+        str
+            The human readable message
+        """
+        if score <= 50:
+            return 'Elements use colors foreign to the palette'
+        elif score <= 80:
+            return 'Some elements stray from the palette'
+        else:
+            return 'Elements consistently follow the palette!'
@@ -0,0 +1,135 @@
+from .image import ImageRater
+from .models import Rating
+from .constants import MAX_SCORE
+from ..opencv import (box_pixels, box_histograms)
+from typing import Final
+import numpy as np
+
+
+class ContrastRater(ImageRater):
+
+    __average_contrast_id: Final[str] = 'contrast_average'
+    __compliance_contrast_id: Final[str] = 'contrast_compliance'
+
+    # WCAG AA minimum contrast ratio for regular text
+    __min_ratio: Final[float] = 4.5
+    __luminance_bins: Final[int] = 32
+    # Boxes whose minority pixels cover less than this share are considered plain, and have no foreground
+    __min_foreground_share: Final[float] = 0.01
+
+    def rate(self) -> list[Rating]:
+        ratios = self.contrast_ratios()
+        ratios = ratios[~np.isnan(ratios)]
+        if len(ratios) == 0:
+            return [
+                Rating(self.__average_contrast_id, MAX_SCORE, 'No text or icons to assess'),
+                Rating(self.__compliance_contrast_id, MAX_SCORE, 'No text or icons to assess')
+            ]
+        # Results
+        normalized = np.clip((ratios - 1) / (self.__min_ratio - 1), 0, 1)
+        average_hr = int(MAX_SCORE * normalized.mean())
+        compliance_hr = int(MAX_SCORE * (ratios >= self.__min_ratio).mean())
+        return [
+            Rating(self.__average_contrast_id, average_hr, self.get_average_message(average_hr)),
+            Rating(self.__compliance_contrast_id, compliance_hr, self.get_compliance_message(compliance_hr))
+        ]
+
+    def contrast_ratios(self) -> np.ndarray:
+        """
+        Splits every box in foreground and background pixels (Otsu's threshold over the box luminance histogram),
+        all boxes being processed at once
+
+        Returns:
+        --------
+        np.ndarray
+            The WCAG contrast ratio between each box foreground and background, NaN for plain boxes
+        """
+        boxes = self._boxes()
+        luminance = relative_luminance(self._image)
+        bins = np.minimum((luminance * self.__luminance_bins).astype(np.intp), self.__luminance_bins - 1)
+        box_ids, pixels = box_pixels(luminance.shape, boxes)
+        counts = box_histograms(bins, self.__luminance_bins, box_ids, pixels, box_count=len(boxes))
+        sums = box_histograms(bins, self.__luminance_bins, box_ids, pixels, luminance, len(boxes))
+        # Dark class (bins up to the threshold) and light class statistics, for every threshold
+        dark_counts = np.cumsum(counts, axis=1)
+        dark_sums = np.cumsum(sums, axis=1)
+        light_counts = dark_counts[:, -1:] - dark_counts
+        light_sums = dark_sums[:, -1:] - dark_sums
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dark_means = dark_sums / dark_counts
+            light_means = light_sums / light_counts
+            between_variance = np.nan_to_num(dark_counts * light_counts * (light_means - dark_means) ** 2)
+            thresholds = np.argmax(between_variance, axis=1)
+            rows = np.arange(len(boxes))
+            dark_count = dark_counts[rows, thresholds]
+            light_count = light_counts[rows, thresholds]
+            dark_mean = dark_means[rows, thresholds]
+            light_mean = light_means[rows, thresholds]
+            ratios = (light_mean + 0.05) / (dark_mean + 0.05)
+            minority_share = np.minimum(dark_count, light_count) / (dark_count + light_count)
+        ratios[~(minority_share >= self.__min_foreground_share)] = np.nan
+        return ratios
+
+    def get_average_message(self, score: int) -> str:
+        """
+        Generates a human readable message for the given score
+
+        Parameters:
+        -----------
+        score : int
+            The raw score from which the message will be extrapolated
+
+        Returns:
+        --------
+        str
+            The human readable message
+        """
+        if score <= 30:
+            return 'Content is hard to tell apart from its background'
+        elif score <= 60:
+            return 'Contrast is low across the screen'
+        elif score <= 85:
+            return 'Overall decent contrast'
+        else:
+            return 'Excellent contrast!'
+
+    def get_compliance_message(self, score: int) -> str:
+        """
+        Generates a human readable message for the given score
+
+        Parameters:
+        -----------
+        score : int
+            The share of elements meeting the minimum contrast ratio
+
+        Returns:
+        --------
+        str
+            The human readable message
+        """
+        if score <= 50:
+            return 'Most elements miss the minimum contrast ratio'
+        elif score <= 80:
+            return 'Some elements miss the minimum contrast ratio'
+        elif score < MAX_SCORE:
+            return 'Few elements miss the minimum contrast ratio'
+        else:
+            return 'Every element meets the minimum contrast ratio!'
+
+
+def relative_luminance(image: np.ndarray) -> np.ndarray:
+    """
+    Parameters:
+    -----------
+    image : np.ndarray
+        The BGR image
+
+    Returns:
+    --------
+    np.ndarray
+        The WCAG relative luminance of every pixel, ranging from 0 to 1
+    """
+    channel = np.arange(256, dtype=np.float32) / 255
+    linear = np.where(channel <= 0.04045, channel / 12.92, ((channel + 0.055) / 1.055) ** 2.4)
+    weights = np.array([0.0722, 0.7152, 0.2126], dtype=np.float32)
+    return linear.astype(np.float32)[image] @ weights
@@ -10,17 +10,10 @@ class EquilibriumRater(Rater):
 
     def rate(self) -> list[Rating]:
         # Weights
-        areas_sum = 0.0
-        h_sum = 0.0
-        v_sum = 0.0
-        # Computing
-        for element in self._elements:
-            areas_sum += element.area(self._canvas)
-            h_sum += element.area(self._canvas) * element.x_midpoint(self._canvas)
-            v_sum += element.area(self._canvas) * element.y_midpoint(self._canvas)
+        total = self._quadrants.total
         # Partial result
-        layout_center_x = h_sum / areas_sum
-        layout_center_y = v_sum / areas_sum
+        layout_center_x = total.area_x / total.area
+        layout_center_y = total.area_y / total.area
         # Result
         norm_h_score = (self._canvas.x_midpoint - layout_center_x) / max(self._canvas.x_midpoint, layout_center_x)
         norm_v_score = (self._canvas.y_midpoint - layout_center_y) / max(self._canvas.y_midpoint, layout_center_y)
@@ -23,9 +23,8 @@ class HarmonyRater(Rater):
         """
         # Computing
         canvas_area = self._canvas.width * self._canvas.height
-        el_areas = [element.area(self._canvas) for element in self._elements]
         # Result
-        score = sum(el_areas) / canvas_area
+        score = self._quadrants.total.area / canvas_area
         score_hr = int(MAX_SCORE * (1 - abs(score - 0.65) / 0.65))
         msg = ''
         if 0 <= score <= 0.35:
@@ -43,16 +42,8 @@ class HarmonyRater(Rater):
         Rating
             The rating for the proportion metric
         """
-        # Computing
-        proportions = [(el.width / el.height) for el in self._elements]
-        similarity = []
-        for i1, p1 in enumerate(proportions):
-            for i2, p2 in enumerate(proportions):
-                if i1 == i2:
-                    continue
-                similarity.append((abs(p1 - p2)/max(p1, p2)))
         # Results
-        score = 1 - sum(similarity)/len(similarity)
+        score = self._proportion
         score_hr = int(MAX_SCORE * score)
         msg = ''
         if 0 <= score_hr <= 35:
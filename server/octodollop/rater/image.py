@@ -0,0 +1,53 @@
+from abc import ABC
+from typing import Final, Optional
+
+import numpy as np
+
+from .rater import Rater
+from .models import (Element, Canvas)
+from .aggregate import Quadrants
+from ..opencv import (IntegralImage, threshold, content_mass)
+
+
+class ImageRater(Rater, ABC):
+
+    def __init__(self, canvas: Canvas, elements: list[Element], image: np.ndarray,
+                 quadrants: Optional[Quadrants] = None, mass: Optional[IntegralImage] = None):
+        """
+        Parameters:
+        -----------
+        canvas : Canvas
+            The canvas in which elements are contained in
+        elements : list[Element]
+            The elements whose features ought to be rated
+        image : np.ndarray
+            The BGR screenshot the elements were detected in, possibly downscaled
+        quadrants : Quadrants | None
+            The precomputed summary of the visible content in the canvas absolute coordinates,
+            computed from the elements on first use if not provided
+        mass : IntegralImage | None
+            The summed-area table of the screenshot content mask, possibly at a different resolution than the image,
+            computed from the image on first use if not provided
+        """
+        super().__init__(canvas, elements, quadrants)
+        self._image: Final[np.ndarray] = image
+        self.__mass: Optional[IntegralImage] = mass
+
+    @property
+    def _mass(self) -> IntegralImage:
+        """ The summed-area table of the screenshot content mask """
+        if self.__mass is None:
+            self.__mass = content_mass(threshold(self._image))
+        return self.__mass
+
+    def _boxes(self) -> np.ndarray:
+        """
+        Returns:
+        --------
+        np.ndarray
+            The elements integer pixel boxes in the image, one row per element with columns x, y, width, height
+        """
+        height, width = self._image.shape[:2]
+        relative = np.array([[el.x, el.y, el.width, el.height] for el in self._elements], dtype=np.float64)
+        relative = relative.reshape(-1, 4)
+        return np.rint(relative * np.array([width, height, width, height])).astype(np.intp)
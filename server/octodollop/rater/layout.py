@@ -0,0 +1,147 @@
+from typing import Final, Iterator, Optional
+
+from .aggregate import (Aggregate, Quadrants, proportion_similarity)
+from .models import (Element, Container, Canvas)
+
+
+class LayoutNode:
+
+    def __init__(self, element: Element, parent: Optional['LayoutNode'] = None):
+        """
+        Node of a nested layout, caching the summaries of its subtree.
+        Summaries are expressed in the node's own unit frame, so they do not depend on the canvas size:
+        they are computed once, reused as they are by every ancestor and only scaled for each canvas
+
+        Parameters:
+        -----------
+        element : Element
+            The element this node stands for, its children (if any) become child nodes
+        parent : LayoutNode | None
+            The enclosing node, None for the root
+        """
+        self.parent: Final[Optional[LayoutNode]] = parent
+        self.element: Element = element
+        self.children: list[LayoutNode] = list()
+        self.__aggregate: Optional[Aggregate] = None
+        self.__quadrants: Optional[Quadrants] = None
+        self.__proportion: Optional[float] = None
+        self.__build_children()
+
+    @classmethod
+    def root(cls, elements: list[Element]):
+        """ Instantiates the root node of a screen, spanning the whole canvas """
+        return cls(Container(0.0, 0.0, 1.0, 1.0, None, elements))
+
+    @property
+    def is_container(self) -> bool:
+        return len(self.children) > 0
+
+    @property
+    def aggregate(self) -> Aggregate:
+        """ The summary of the leaves in the subtree, in the node's unit frame """
+        if self.__aggregate is None:
+            if not self.is_container:
+                self.__aggregate = Aggregate.unit()
+            else:
+                aggregate = Aggregate()
+                for child in self.children:
+                    aggregate += child.__aggregate_in_parent()
+                self.__aggregate = aggregate
+        return self.__aggregate
+
+    @property
+    def quadrants(self) -> Quadrants:
+        """
+        The leaves in the subtree split around the node's midpoint, in the node's unit frame.
+        Leaves are classified in relative coordinates, as flat elements are, so the split holds on every canvas
+        """
+        if self.__quadrants is None:
+            quadrants = Quadrants(0.5, 0.5)
+            self.__collect(quadrants, 0.0, 0.0, 1.0, 1.0)
+            self.__quadrants = quadrants
+        return self.__quadrants
+
+    @property
+    def proportion(self) -> float:
+        """ The similarity of the children aspect ratios, see `proportion_similarity` """
+        if self.__proportion is None:
+            self.__proportion = proportion_similarity([child.element for child in self.children])
+        return self.__proportion
+
+    def update(self, element: Element):
+        """
+        Replaces the node's element (and subtree), only the summaries on the path to the root are invalidated
+
+        Parameters:
+        -----------
+        element : Element
+            The new element
+        """
+        self.element = element
+        self.__build_children()
+        node = self
+        while node is not None:
+            node.__aggregate = None
+            node.__quadrants = None
+            node.__proportion = None
+            node = node.parent
+
+    def containers(self, canvas: Canvas, path: Optional[list[int]] = None) -> Iterator[tuple[list[int], 'LayoutNode', Canvas]]:
+        """
+        Parameters:
+        -----------
+        canvas : Canvas
+            The node's absolute size
+        path : list[int] | None
+            The children indexes leading from the root to this node
+
+        Returns:
+        --------
+        Iterator[tuple[list[int], LayoutNode, Canvas]]
+            The containers in the subtree, in pre-order, along with their path and absolute size
+        """
+        path = path if path is not None else list()
+        if not self.is_container:
+            return
+        yield path, self, canvas
+        for index, child in enumerate(self.children):
+            child_canvas = Canvas(child.element.absolute_width(canvas), child.element.absolute_height(canvas))
+            yield from child.containers(child_canvas, path + [index])
+
+    def __build_children(self):
+        children = self.element.children if isinstance(self.element, Container) else list()
+        self.children = [LayoutNode(child, self) for child in children]
+
+    def __aggregate_in_parent(self) -> Aggregate:
+        return self.aggregate.transformed(self.element.x, self.element.y, self.element.width, self.element.height)
+
+    def __collect(self, quadrants: Quadrants, x: float, y: float, width: float, height: float):
+        """
+        Adds the leaves in the subtree to the quadrants. Children lying entirely in one quadrant
+        contribute their cached summary, only children straddling an axis are descended into
+
+        Parameters:
+        -----------
+        quadrants : Quadrants
+            The quadrants to be updated
+        x : float
+            The node's x coordinate in the quadrants frame
+        y : float
+            The node's y coordinate in the quadrants frame
+        width : float
+            The node's width in the quadrants frame
+        height : float
+            The node's height in the quadrants frame
+        """
+        for child in self.children:
+            child_x = x + width * child.element.x
+            child_y = y + height * child.element.y
+            child_width = width * child.element.width
+            child_height = height * child.element.height
+            straddles_x = child_x < quadrants.x_pivot < child_x + child_width
+            straddles_y = child_y < quadrants.y_pivot < child_y + child_height
+            if child.is_container and (straddles_x or straddles_y):
+                child.__collect(quadrants, child_x, child_y, child_width, child_height)
+            else:
+                quadrants.add(child.aggregate.transformed(child_x, child_y, child_width, child_height),
+                              child_x + child_width / 2, child_y + child_height / 2)
@@ -21,7 +21,19 @@ class Canvas:
     @classmethod
     def from_json(cls, json):
         """ Instantiates object from json dictionary """
-        return cls(**json)
+        return cls(json['width'], json['height'])
+
+    def serialize(self) -> dict:
+        """
+        Returns:
+        --------
+        dict
+            The JSON serialized object
+        """
+        return {
+            'width': self.width,
+            'height': self.height
+        }
 
 
 class Element:
@@ -50,6 +62,8 @@ class Element:
     @classmethod
     def from_json(cls, json: dict):
         """ Instantiates object from json dictionary """
+        if 'children' in json.keys():
+            return Container.from_json(json)
         if 'annotation' in json.keys():
             return cls(**json)
         return cls(json['x'], json['y'], json['width'], json['height'], None)
@@ -153,6 +167,38 @@ class Element:
         return self.absolute_width(canvas) * self.absolute_height(canvas)
 
 
+class Container(Element):
+
+    def __init__(self, x: float, y: float, width: float, height: float, annotation: Optional[str],
+                 children: list[Element]):
+        """
+        Element grouping other elements, e.g. a list cell or a tab
+
+        Parameters:
+        -----------
+        x : float
+            The container relative x position on its parent
+        y : float
+            The container relative y position on its parent
+        width : float
+            The container width as a proportion of its parent width
+        height : float
+            The container height as a proportion of its parent height
+        annotation : str | None
+            Any comment or feedback associated to the container
+        children : list[Element]
+            The contained elements, whose coordinates are relative to the container
+        """
+        super().__init__(x, y, width, height, annotation)
+        self.children: Final[list[Element]] = children
+
+    @classmethod
+    def from_json(cls, json: dict):
+        """ Instantiates object from json dictionary """
+        children = [Element.from_json(child_json) for child_json in json['children']]
+        return cls(json['x'], json['y'], json['width'], json['height'], json.get('annotation'), children)
+
+
 class Rating:
 
     def __init__(self, id_: str, rating: int, comment: str):
@@ -0,0 +1,19 @@
+from .image import ImageRater
+from .balance import BalanceRater
+import numpy as np
+
+
+class PixelBalanceRater(ImageRater, BalanceRater):
+
+    _h_balance_id = 'pixel_balance_horizontal'
+    _v_balance_id = 'pixel_balance_vertical'
+
+    def _weights(self) -> tuple[float, float, float, float]:
+        # Visual mass being the screenshot content pixels, rather than the elements bounding boxes
+        mass = self._mass
+        columns = mass.columns(0, 0, mass.width, mass.height)
+        rows = mass.rows(0, 0, mass.width, mass.height)
+        h_moments = columns * (np.arange(mass.width) + 0.5 - mass.width / 2)
+        v_moments = rows * (np.arange(mass.height) + 0.5 - mass.height / 2)
+        return (float(-h_moments[h_moments < 0].sum()), float(h_moments[h_moments > 0].sum()),
+                float(-v_moments[v_moments < 0].sum()), float(v_moments[v_moments > 0].sum()))
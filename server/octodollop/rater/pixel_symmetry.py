@@ -0,0 +1,46 @@
+from .image import ImageRater
+from .symmetry import SymmetryRater
+from typing import Final, Optional
+import numpy as np
+
+
+class PixelSymmetryRater(ImageRater, SymmetryRater):
+
+    _h_symmetry_id = 'pixel_symmetry_horizontal'
+    _v_symmetry_id = 'pixel_symmetry_vertical'
+    _r_symmetry_id = 'pixel_symmetry_radial'
+
+    # The screenshot is split in a grid of cells, each compared to its mirrored counterpart
+    __grid_size: Final[int] = 16
+
+    def _symmetry(self) -> tuple[float, float, Optional[float]]:
+        # Content density of every cell, one lookup each in the summed-area table
+        mass = self._mass
+        x_edges = np.rint(np.linspace(0, mass.width, self.__grid_size + 1)).astype(np.intp)
+        y_edges = np.rint(np.linspace(0, mass.height, self.__grid_size + 1)).astype(np.intp)
+        x, y = np.meshgrid(x_edges[:-1], y_edges[:-1])
+        width, height = np.meshgrid(np.diff(x_edges), np.diff(y_edges))
+        density = mass.region(x, y, width, height) / np.maximum(width * height, 1)
+        return (self.__diff(density, density[:, ::-1]),
+                self.__diff(density, density[::-1, :]),
+                self.__diff(density, density[::-1, ::-1]))
+
+    def __diff(self, cells: np.ndarray, mirrored: np.ndarray) -> float:
+        """
+        Parameters:
+        -----------
+        cells : np.ndarray
+            The cells content density
+        mirrored : np.ndarray
+            The mirrored cells content density
+
+        Returns:
+        --------
+        float
+            The normalized difference between the cells and their mirrored counterpart, ranging from 0 to 1,
+            following the geometric rater's convention
+        """
+        total = (cells + mirrored).sum()
+        if total == 0:
+            return 0.0
+        return float(np.abs(cells - mirrored).sum() / total)
@@ -1,12 +1,14 @@
 from abc import (ABC, abstractmethod)
-from typing import Final
+from typing import Final, Optional
 
 from .models import (Element, Canvas, Rating)
+from .aggregate import (Quadrants, proportion_similarity)
 
 
 class Rater(ABC):
 
-    def __init__(self, canvas: Canvas, elements: list[Element]):
+    def __init__(self, canvas: Canvas, elements: list[Element], quadrants: Optional[Quadrants] = None,
+                 proportion: Optional[float] = None):
         """
         Parameters:
         -----------
@@ -14,9 +16,31 @@ class Rater(ABC):
             The canvas in which elements are contained in
         elements : list[Element]
             The elements whose features ought to be rated
+        quadrants : Quadrants | None
+            The precomputed summary of the visible content in the canvas absolute coordinates,
+            computed from the elements on first use if not provided
+        proportion : float | None
+            The precomputed similarity of the elements aspect ratios, computed from the elements on first use
+            if not provided
         """
         self._canvas: Final[Canvas] = canvas
         self._elements: Final[list[Element]] = elements
+        self.__quadrants: Optional[Quadrants] = quadrants
+        self.__proportion: Optional[float] = proportion
+
+    @property
+    def _quadrants(self) -> Quadrants:
+        """ The summary of the elements in the canvas absolute coordinates """
+        if self.__quadrants is None:
+            self.__quadrants = Quadrants.of_elements(self._elements, self._canvas)
+        return self.__quadrants
+
+    @property
+    def _proportion(self) -> float:
+        """ The similarity of the elements aspect ratios, ranging from 0 to 1 """
+        if self.__proportion is None:
+            self.__proportion = proportion_similarity(self._elements)
+        return self.__proportion
 
     @abstractmethod
     def rate(self) -> list[Rating]:
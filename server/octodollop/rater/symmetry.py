@@ -1,64 +1,69 @@
 from .rater import Rater
-from .models import (Rating, Element)
+from .models import Rating
+from .aggregate import Aggregate
 from .constants import MAX_SCORE
+from typing import Optional
 
 
 class SymmetryRater(Rater):
 
-    __h_symmetry_id = 'symmetry_horizontal'
-    __v_symmetry_id = 'symmetry_vertical'
-    __r_symmetry_id = 'symmetry_radial'
+    _h_symmetry_id = 'symmetry_horizontal'
+    _v_symmetry_id = 'symmetry_vertical'
+    _r_symmetry_id = 'symmetry_radial'
 
     def rate(self) -> list[Rating]:
+        vertical, horizontal, radial = self._symmetry()
+        # Results
+        v_hr = int(MAX_SCORE * vertical)
+        h_hr = int(MAX_SCORE * horizontal)
+        ratings: list[Rating] = [
+            Rating(self._v_symmetry_id, v_hr, self.get_message(v_hr)),
+            Rating(self._h_symmetry_id, h_hr, self.get_message(h_hr)),
+        ]
+        if radial is not None:
+            r_hr = int(MAX_SCORE * radial)
+            ratings.append(Rating(self._r_symmetry_id, r_hr, self.get_message(r_hr)))
+        return ratings
+
+    def _symmetry(self) -> tuple[float, float, Optional[float]]:
+        """
+        Returns:
+        --------
+        tuple[float, float, float | None]
+            The vertical, horizontal and radial normalized scores, ranging from 0 to 1, each being the
+            relative difference between the weights on the two sides of the axis (the rater's scoring convention).
+            The radial score is None when not assessed
+        """
         # Weights
-        w_top_left: dict[str, float] = {'x': 0.0, 'y': 0.0, 'w': 0.0, 'h': 0.0}
-        w_top_right = {'x': 0.0, 'y': 0.0, 'w': 0.0, 'h': 0.0}
-        w_bottom_left = {'x': 0.0, 'y': 0.0, 'w': 0.0, 'h': 0.0}
-        w_bottom_right = {'x': 0.0, 'y': 0.0, 'w': 0.0, 'h': 0.0}
-        # Computing
-        for element in self._elements:
-            x_midpoint = element.x_midpoint(self._canvas)
-            y_midpoint = element.y_midpoint(self._canvas)
-            # Top left
-            if x_midpoint <= self._canvas.x_midpoint and y_midpoint <= self._canvas.y_midpoint:
-                self.__update_weights(w_top_left, element)
-            # Top right
-            elif x_midpoint >= self._canvas.x_midpoint and y_midpoint <= self._canvas.y_midpoint:
-                self.__update_weights(w_top_right, element)
-            # Bottom left
-            if x_midpoint <= self._canvas.x_midpoint and y_midpoint >= self._canvas.y_midpoint:
-                self.__update_weights(w_bottom_left, element)
-            # Bottom right
-            if x_midpoint >= self._canvas.x_midpoint and y_midpoint >= self._canvas.y_midpoint:
-                self.__update_weights(w_bottom_right, element)
+        w_top_left = self.__weights(self._quadrants.top_left)
+        w_top_right = self.__weights(self._quadrants.top_right)
+        w_bottom_left = self.__weights(self._quadrants.bottom_left)
+        w_bottom_right = self.__weights(self._quadrants.bottom_right)
         # Results
         v_top = self.__diff(w_top_left, w_top_right)
         v_bottom = self.__diff(w_bottom_left, w_bottom_right)
-        v_hr = int(MAX_SCORE * (v_top + v_bottom) / 2)
         h_left = self.__diff(w_top_left, w_bottom_left)
         h_right = self.__diff(w_top_right, w_bottom_right)
-        h_hr = int(MAX_SCORE * (h_left + h_right) / 2)
-        ratings: list[Rating] = [
-            Rating(self.__v_symmetry_id, v_hr, self.get_message(v_hr)),
-            Rating(self.__h_symmetry_id, h_hr, self.get_message(h_hr)),
-        ]
-        return ratings
+        return (v_top + v_bottom) / 2, (h_left + h_right) / 2, None
 
-    def __update_weights(self, weights: dict[str, float], element: Element):
+    def __weights(self, quadrant: Aggregate) -> dict[str, float]:
         """
-        Updates the weights accounting with the new element's data
-
         Parameters:
         -----------
-        weights : dict[str, float]
-            The weights to be updated. Convention: 'x', 'y', 'w', 'h' weight keys
-        element : Element
-            The element used to update the weights
+        quadrant : Aggregate
+            The folded summary of the elements in a quadrant
+
+        Returns:
+        --------
+        dict[str, float]
+            The quadrant weights. Convention: 'x', 'y', 'w', 'h' weight keys
         """
-        weights['x'] += abs(element.x_midpoint(self._canvas) - self._canvas.x_midpoint)
-        weights['y'] += abs(element.y_midpoint(self._canvas) - self._canvas.y_midpoint)
-        weights['w'] += element.absolute_width(self._canvas)
-        weights['h'] += element.absolute_height(self._canvas)
+        return {
+            'x': quadrant.x_sum,
+            'y': quadrant.y_sum,
+            'w': quadrant.w_sum,
+            'h': quadrant.h_sum
+        }
 
     def __diff(self, w1: dict[str, float], w2: dict[str, float]) -> float:
         """
@@ -0,0 +1,76 @@
+from ..rater import (Canvas, LayoutNode, get_rater)
+from .models import (MetricGroup, RatingResponse, ContainerRating)
+from typing import Final
+
+
+def rate_layout(layout: LayoutNode, canvas: Canvas) -> RatingResponse:
+    """
+    Rates the whole screen, then every nested container relative to its own bounds
+
+    Parameters:
+    -----------
+    layout : LayoutNode
+        The root of the layout to be rated
+    canvas : Canvas
+        The screen canvas
+
+    Returns:
+    --------
+    RatingResponse
+        The screen ratings, along with the nested containers ones
+    """
+    screen_response = rate_container(layout, canvas)
+    containers: list[ContainerRating] = list()
+    for path, node, node_canvas in layout.containers(canvas):
+        if path:
+            containers.append(ContainerRating(path, rate_container(node, node_canvas)))
+    return RatingResponse(screen_response.score, screen_response.metrics, containers)
+
+
+def rate_container(node: LayoutNode, canvas: Canvas) -> RatingResponse:
+    """
+    Parameters:
+    -----------
+    node : LayoutNode
+        The container to be rated
+    canvas : Canvas
+        The container absolute size
+
+    Returns:
+    --------
+    RatingResponse
+        The container ratings, its direct children being the rated elements
+    """
+    elements = [child.element for child in node.children]
+    # Canvas independent summaries are cached by the node, only the geometry is scaled to the canvas
+    quadrants = node.quadrants.scaled(canvas.width, canvas.height)
+    # Computing ratings
+    ratings: list[MetricGroup] = list()
+    for rater_type in __raters:
+        rater = get_rater(rater_type, elements, canvas, quadrants, node.proportion)
+        ratings.append(MetricGroup(rater_type, rater.rate()))
+    return RatingResponse(overall_score(ratings), ratings)
+
+
+def overall_score(ratings: list[MetricGroup]) -> int:
+    """
+    Parameters:
+    -----------
+    ratings : list[MetricGroup]
+        The ratings taken into account
+
+    Returns:
+    --------
+    int
+        The average of the groups scores, each group scoring the average of its metrics
+    """
+    rating_results = 0
+    for group in ratings:
+        partial_result = 0
+        for res in group.metrics:
+            partial_result += res.rating
+        rating_results += int(partial_result / len(group.metrics))
+    return int(rating_results / len(ratings))
+
+
+__raters: Final[list[str]] = ['balance', 'equilibrium', 'symmetry', 'harmony']
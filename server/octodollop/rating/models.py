@@ -1,5 +1,5 @@
-from ..rater import Rating
-from typing import Final
+from ..rater import (Rating, Canvas)
+from typing import Final, Optional
 
 
 class MetricGroup:
@@ -36,7 +36,7 @@ class MetricGroup:
 
 class RatingResponse:
 
-    def __init__(self, score: int, ratings: list[MetricGroup]):
+    def __init__(self, score: int, ratings: list[MetricGroup], containers: Optional[list['ContainerRating']] = None):
         """
         Response to ratings requests
 
@@ -46,9 +46,12 @@ class RatingResponse:
             The overall achieved rating score
         ratings : list[MetricGroup]
             The various ratings taken into account when computing the score
+        containers : list[ContainerRating] | None
+            The ratings of the nested containers, each relative to its own bounds
         """
         self.score: Final[int] = score
         self.metrics: Final[list[MetricGroup]] = ratings
+        self.containers: Final[list[ContainerRating]] = containers if containers is not None else list()
 
     def serialize(self) -> dict:
         """
@@ -62,5 +65,100 @@ class RatingResponse:
             metrics_json.append(metric.serialize())
         return {
             'score': self.score,
-            'metrics': metrics_json
+            'metrics': metrics_json,
+            'containers': [container.serialize() for container in self.containers]
+        }
+
+
+class ContainerRating:
+
+    def __init__(self, path: list[int], response: RatingResponse):
+        """
+        Ratings of a nested container
+
+        Parameters:
+        -----------
+        path : list[int]
+            The children indexes leading from the request items to the container
+        response : RatingResponse
+            The container ratings
+        """
+        self.path: Final[list[int]] = path
+        self.response: Final[RatingResponse] = response
+
+    def serialize(self) -> dict:
+        """
+        Returns:
+        --------
+        dict
+            The JSON serialized object
+        """
+        return {
+            'path': self.path,
+            **self.response.serialize()
+        }
+
+
+class MultiCanvasResponse:
+
+    def __init__(self, canvases: list[Canvas], responses: list[RatingResponse]):
+        """
+        Response to ratings requests of one layout across several canvas sizes
+
+        Parameters:
+        -----------
+        canvases : list[Canvas]
+            The canvases the layout was rated on
+        responses : list[RatingResponse]
+            The ratings for each canvas, in the same order
+        """
+        self.canvases: Final[list[Canvas]] = canvases
+        self.responses: Final[list[RatingResponse]] = responses
+
+    def serialize(self) -> dict:
+        """
+        Returns:
+        --------
+        dict
+            The JSON serialized object
+        """
+        ratings_json: list[dict] = list()
+        for canvas, response in zip(self.canvases, self.responses):
+            ratings_json.append({
+                'canvas': canvas.serialize(),
+                **response.serialize()
+            })
+        # Scores of each metric across canvases
+        metric_scores: dict[str, list[int]] = dict()
+        for response in self.responses:
+            for group in response.metrics:
+                for metric in group.metrics:
+                    metric_scores.setdefault(metric.id_, list()).append(metric.rating)
+        return {
+            'ratings': ratings_json,
+            'summary': {
+                'score': self.__variation([response.score for response in self.responses]),
+                'metrics': {id_: self.__variation(scores) for id_, scores in metric_scores.items()}
+            }
+        }
+
+    def __variation(self, scores: list[int]) -> dict:
+        """
+        Parameters:
+        -----------
+        scores : list[int]
+            The scores achieved on each canvas
+
+        Returns:
+        --------
+        dict
+            How the scores vary across canvases, with keys 'min', 'max', 'mean', 'spread' and 'worst_canvas',
+            the latter being the index of the lowest scoring canvas
+        """
+        return {
+            'min': min(scores),
+            'max': max(scores),
+            'mean': sum(scores) / len(scores),
+            'spread': max(scores) - min(scores),
+            'worst_canvas': scores.index(min(scores))
         }
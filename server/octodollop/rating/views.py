@@ -1,36 +1,57 @@
-from ..rater import (Element, Canvas, get_rater)
-from .models import (MetricGroup, RatingResponse)
+from ..rater import (Element, Canvas, LayoutNode)
+from .models import MultiCanvasResponse
+from .helpers import rate_layout
 from flask import (Blueprint, request, jsonify, abort)
+import math
 
 bp = Blueprint('rating', __name__, url_prefix='/rating')
 
 
 @bp.route('', methods=['POST'])
 def rate():
-    # Request form validation
+    # Request form validation, 'canvas' (single canvas) and 'canvases' (non-empty list) are mutually exclusive
     content = request.get_json()
     canvas_json = content.get('canvas')
+    canvases_json = content.get('canvases')
     items_json = content.get('items')
-    if canvas_json is None or items_json is None:
+    if (canvas_json is None) == (canvases_json is None) or items_json is None:
         abort(400)
+    if canvases_json is not None and (not isinstance(canvases_json, list) or not canvases_json):
+        abort(400)
+    for c_json in ([canvas_json] if canvases_json is None else canvases_json):
+        if not is_valid_canvas(c_json):
+            abort(400)
     # Decoding request JSON
-    canvas = Canvas.from_json(canvas_json)
     elements = []
     for item_json in items_json:
         elements.append(Element.from_json(item_json))
-    # Partial results
-    ratings: list[MetricGroup] = list()
-    rating_results = 0
-    # Computing ratings
-    raters = ['balance', 'equilibrium', 'symmetry', 'harmony']
-    for rater_type in raters:
-        rater_res = get_rater(rater_type, elements, canvas).rate()
-        # Saving rating results
-        partial_result = 0
-        for res in rater_res:
-            partial_result += res.rating
-        rating_results += int(partial_result / len(rater_res))
-        ratings.append(MetricGroup(rater_type, rater_res))
-    # Sending response
-    response = RatingResponse(int(rating_results/len(raters)), ratings)
-    return jsonify(response.serialize())
+    if not elements:
+        abort(400)
+    # Canvas independent geometry is cached by the layout, and shared by every canvas
+    layout = LayoutNode.root(elements)
+    if canvases_json is None:
+        response = rate_layout(layout, Canvas.from_json(canvas_json))
+        return jsonify(response.serialize())
+    canvases = [Canvas.from_json(c_json) for c_json in canvases_json]
+    responses = [rate_layout(layout, canvas) for canvas in canvases]
+    return jsonify(MultiCanvasResponse(canvases, responses).serialize())
+
+
+def is_valid_canvas(canvas_json) -> bool:
+    """
+    Parameters:
+    -----------
+    canvas_json
+        The decoded canvas JSON
+
+    Returns:
+    --------
+    bool
+        Whether the canvas is an object with positive, finite numeric 'width' and 'height'
+    """
+    if not isinstance(canvas_json, dict):
+        return False
+    for size in (canvas_json.get('width'), canvas_json.get('height')):
+        if isinstance(size, bool) or not isinstance(size, (int, float)) or not math.isfinite(size) or size <= 0:
+            return False
+    return True